@@ -1,4 +1,4 @@
-from pathlib import Path
+import os
 
 # List of files to create
 files = [
@@ -32,16 +32,20 @@ files = [
     'src/utils/logger.ts',
 ]
 
-for file_path in files:
-    path = Path(file_path)
-    # Create parent directories if they don't exist
-    if not path.parent.exists():
-        path.parent.mkdir(parents=True, exist_ok=True)
-        print(f"Created directory: {path.parent}")
+# Create each unique parent directory once; existing dirs are skipped silently
+for directory in sorted({os.path.dirname(file_path) or '.' for file_path in files}):
+    try:
+        os.makedirs(directory)
+        print(f"Created directory: {directory}")
+    except FileExistsError:
+        pass
 
-    # Create the file if it doesn't exist
-    if not path.exists():
-        path.touch()
-        print(f"Created file: {path}")
+for file_path in files:
+    # O_EXCL creates the file only if it doesn't exist, in a single syscall
+    try:
+        fd = os.open(file_path, os.O_CREAT | os.O_EXCL | os.O_WRONLY, 0o666)
+    except FileExistsError:
+        print(f"Skipped existing file: {file_path}")
     else:
-        print(f"Skipped existing file: {path}")
+        os.close(fd)
+        print(f"Created file: {file_path}")
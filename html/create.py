@@ -31,12 +31,15 @@ def create_structure(base_dir: Path, spec: dict):
         dir_path.mkdir(parents=True, exist_ok=True)
         # Create each file
         for filename in files:
-            file_path = dir_path / filename
-            if not file_path.exists():
-                file_path.touch()
-                print(f"Created: {file_path}")
-            else:
+            file_path = os.path.join(dir_path, filename)
+            # O_EXCL creates the file only if it doesn't exist, in a single syscall
+            try:
+                fd = os.open(file_path, os.O_CREAT | os.O_EXCL | os.O_WRONLY, 0o666)
+            except FileExistsError:
                 print(f"Already exists: {file_path}")
+            else:
+                os.close(fd)
+                print(f"Created: {file_path}")
 
 if __name__ == '__main__':
     # Assume this script lives in the riskpay-frontend folder